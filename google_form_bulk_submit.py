@@ -1,168 +1,263 @@
 #!/usr/bin/env python3
 """
 One‑step Google Form bulk submitter.
-Usage: python google_form_bulk_submit.py <FORM_URL> <M>
+Usage: python google_form_bulk_submit.py <FORM_URL> <M> [--rps N]
 """
 
-import sys
+import argparse
+import threading
 import os
 import json
 import re
 import random
 import time
 import hashlib
-from urllib.parse import urlparse, parse_qs
+import math
+import atexit
+import functools
+import tempfile
+import shutil
+import asyncio
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs, urlencode, quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import aiohttp                      # optional: concurrent submissions
+except ImportError:
+    aiohttp = None
+try:
+    import httpx                        # optional: HTTP/2 submissions (needs h2)
+    import h2                           # noqa: F401 – httpx's http2=True requires it
+except ImportError:
+    httpx = None
+try:
+    import uvloop                       # optional: faster event loop
+except ImportError:
+    uvloop = None
+try:
+    from aiolimiter import AsyncLimiter  # optional: token bucket for the async path
+except ImportError:
+    AsyncLimiter = None
+try:
+    import numpy as np                  # optional: batched answer generation
+except ImportError:
+    np = None
+try:
+    import orjson                       # optional: faster cache (de)serialisation
+except ImportError:
+    orjson = None
+try:
+    import lxml.html                    # optional: parse forms without a browser
+except ImportError:
+    lxml = None
+try:
+    from tqdm import tqdm               # optional: progress bar
+except ImportError:
+    tqdm = None
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
 # ------------------------------------------------------------
-# 1.  Form structure extractor (Selenium, used only once per form)
+# 1.  Form structure extractor (used only once per form)
 # ------------------------------------------------------------
-def extract_form_structure(form_url):
-    """Parse the Google Form and return a dict with action_url, fbzx, questions."""
-    print("📡 Parsing form structure with Selenium (one‑time operation)...")
+DRIVER_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'gform_bulk', 'driver_path.json')
+DRIVER_CACHE_TTL = 7 * 24 * 3600    # re-check for chromedriver updates weekly
+
+def get_driver_path():
+    """Return the chromedriver path, calling ChromeDriverManager at most once a week."""
+    try:
+        if time.time() - os.path.getmtime(DRIVER_CACHE) < DRIVER_CACHE_TTL:
+            with open(DRIVER_CACHE, 'r') as f:
+                path = json.load(f)['path']
+            if os.path.exists(path):
+                return path
+    except (OSError, ValueError, KeyError):
+        pass    # missing or unreadable cache – resolve again
+
+    path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(DRIVER_CACHE), exist_ok=True)
+        with open(DRIVER_CACHE, 'w') as f:
+            json.dump({'path': path}, f)
+    except OSError:
+        pass    # caching is best effort
+    return path
+
+# Runs inside the form page and returns {action, fbzx, page_history, questions}.
+# Types are tried in order: radio, checkbox, dropdown, text, paragraph,
+# scale, date, time; the first match wins.
+SCRAPE_FORM_JS = r"""
+function () {
+    function values(nodes, attr) {
+        var out = [];
+        nodes.forEach(function (n) {
+            var v = n.getAttribute(attr);
+            if (v) out.push(v);
+        });
+        return out;
+    }
+    function choices(nodes) {
+        // data-value, falling back to aria-label
+        var vals = values(nodes, 'data-value');
+        return vals.length ? vals : values(nodes, 'aria-label');
+    }
+
+    var form = document.querySelector('form');
+    var fbzx = document.querySelector('[name="fbzx"]');
+    var pageHistory = document.querySelector('[name="pageHistory"]');
+    var questions = [];
+
+    document.querySelectorAll('div[role="listitem"]').forEach(function (qc) {
+        var named = qc.querySelector('[name^="entry."]');
+        if (!named) return;
+        var entryId = named.getAttribute('name').split('_')[0];   // strip _sentinel
+        var type = null, options = [];
+
+        var radios = qc.querySelectorAll('div[role="radio"]');
+        var checkboxes = qc.querySelectorAll('div[role="checkbox"]');
+        var select = qc.querySelector('select');
+        if (radios.length) {
+            type = 'radio';
+            options = choices(radios);
+        } else if (checkboxes.length) {
+            type = 'checkbox';
+            options = choices(checkboxes);
+        } else if (select) {
+            type = 'dropdown';
+            for (var i = 0; i < select.options.length; i++) {
+                if (select.options[i].value) options.push(select.options[i].value);
+            }
+        } else if (qc.querySelector('input[type="text"]')) {
+            type = 'text';
+        } else if (qc.querySelector('textarea')) {
+            type = 'paragraph';
+        } else if (qc.querySelector('div[role="radiogroup"]')) {
+            type = 'scale';
+            options = values(qc.querySelectorAll('div[role="radiogroup"] div[role="radio"]'), 'data-value');
+        } else if (qc.querySelector('input[type="date"]')) {
+            type = 'date';
+        } else if (qc.querySelector('input[type="time"]')) {
+            type = 'time';
+        }
+
+        if (type) questions.push({entry_id: entryId, type: type, options: options});
+    });
+
+    return {
+        action: form.action || form.getAttribute('action'),
+        fbzx: fbzx ? fbzx.value : null,
+        page_history: pageHistory ? pageHistory.value : null,
+        questions: questions
+    };
+}
+"""
+
+# Resources the form page loads but the scraper never needs
+BLOCKED_URLS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.woff', '*.woff2', '*.ttf', '*.css']
+
+_driver = None
+_profile_dir = None
+
+def _chrome_profile():
+    """Return this process's Chrome profile dir (removed at exit).
+
+    Chrome locks its user-data dir, so a fixed shared path would stop a
+    concurrent run, or another user on the host, from starting the browser.
+    """
+    global _profile_dir
+    if _profile_dir is None:
+        _profile_dir = tempfile.mkdtemp(prefix='gform_chrome_')
+        # Registered before any driver.quit, so it runs after Chrome exits
+        atexit.register(shutil.rmtree, _profile_dir, ignore_errors=True)
+    return _profile_dir
+
+def _get_driver():
+    """Return a shared headless Chrome, starting it on first use."""
+    global _driver
+    if _driver is not None:
+        return _driver
 
     options = webdriver.ChromeOptions()
     options.add_argument('--headless=new')          # run in background
     options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument(f'--user-data-dir={_chrome_profile()}')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-dev-shm-usage')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
+    options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
 
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+        service=Service(get_driver_path()),
         options=options
     )
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    try:
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        # The scraper only reads the DOM, so skip styling, fonts and images
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+    except Exception:
+        driver.quit()           # don't leave a half-configured Chrome running
+        raise
+
+    # Only share the browser once it is fully set up
+    atexit.register(driver.quit)
+    _driver = driver
+    return _driver
+
+def _discard_driver():
+    """Quit the shared Chrome so the next parse starts a fresh one."""
+    global _driver
+    if _driver is not None:
+        atexit.unregister(_driver.quit)
+        _driver.quit()
+        _driver = None
+
+def extract_form_structure(form_url, driver=None):
+    """Parse the Google Form and return a dict with action_url, fbzx, questions.
+
+    Uses driver if given, otherwise a shared Chrome kept alive across calls.
+    """
+    print("📡 Parsing form structure with Selenium (one‑time operation)...")
+    shared = driver is None
 
     try:
+        if shared:
+            driver = _get_driver()
         driver.get(form_url)
         WebDriverWait(driver, 15).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, 'form'))
         )
 
+        # One round-trip: the whole traversal runs in the page
+        scraped = driver.execute_script("return (" + SCRAPE_FORM_JS + ")();")
+
         # ---- Action URL ----
-        form = driver.find_element(By.CSS_SELECTOR, 'form')
-        action = form.get_attribute('action')
+        action = scraped['action']
         if not action.startswith('http'):
             action = 'https://docs.google.com' + action
 
         # ---- fbzx (required anti‑spam token) ----
-        fbzx_elem = driver.find_element(By.NAME, 'fbzx')
-        fbzx = fbzx_elem.get_attribute('value')
+        fbzx = scraped['fbzx']
+        if fbzx is None:
+            raise RuntimeError("fbzx token not found")
 
         # ---- Page history (needed for multi‑page forms) ----
-        page_history = None
-        try:
-            page_history_elem = driver.find_element(By.NAME, 'pageHistory')
-            page_history = page_history_elem.get_attribute('value')
-        except NoSuchElementException:
-            pass
+        page_history = scraped['page_history']
 
         # ---- All question containers ----
-        questions = []
-        containers = driver.find_elements(By.CSS_SELECTOR, 'div[role="listitem"]')
-
-        for idx, qc in enumerate(containers):
-            entry_id = None
-            q_type = None
-            options_list = []
-
-            # Find the entry ID from any named element inside this container
-            named = (
-                qc.find_elements(By.CSS_SELECTOR, '[name^="entry."]') +
-                qc.find_elements(By.CSS_SELECTOR, 'select[name^="entry."]')
-            )
-            if named:
-                full_name = named[0].get_attribute('name')
-                entry_id = full_name.split('_')[0]   # strip suffixes like _sentinel
-
-            # ----- Detect type and collect possible answers -----
-            # 1. Radio buttons
-            radios = qc.find_elements(By.CSS_SELECTOR, 'div[role="radio"]')
-            if radios:
-                q_type = 'radio'
-                for r in radios:
-                    val = r.get_attribute('data-value')
-                    if val:
-                        options_list.append(val)
-                if not options_list:
-                    # fallback: use aria-label
-                    options_list = [r.get_attribute('aria-label') for r in radios if r.get_attribute('aria-label')]
-
-            # 2. Checkboxes
-            if not q_type:
-                checkboxes = qc.find_elements(By.CSS_SELECTOR, 'div[role="checkbox"]')
-                if checkboxes:
-                    q_type = 'checkbox'
-                    for cb in checkboxes:
-                        val = cb.get_attribute('data-value')
-                        if val:
-                            options_list.append(val)
-                    if not options_list:
-                        options_list = [cb.get_attribute('aria-label') for cb in checkboxes if cb.get_attribute('aria-label')]
-
-            # 3. Dropdown
-            if not q_type:
-                selects = qc.find_elements(By.TAG_NAME, 'select')
-                if selects:
-                    q_type = 'dropdown'
-                    select = Select(selects[0])
-                    for opt in select.options:
-                        val = opt.get_attribute('value')
-                        if val:
-                            options_list.append(val)
-
-            # 4. Text input (short answer)
-            if not q_type:
-                text_inputs = qc.find_elements(By.CSS_SELECTOR, 'input[type="text"]')
-                if text_inputs:
-                    q_type = 'text'
-
-            # 5. Textarea (paragraph)
-            if not q_type:
-                textareas = qc.find_elements(By.TAG_NAME, 'textarea')
-                if textareas:
-                    q_type = 'paragraph'
-
-            # 6. Linear scale (radiogroup)
-            if not q_type:
-                radiogroups = qc.find_elements(By.CSS_SELECTOR, 'div[role="radiogroup"]')
-                if radiogroups:
-                    q_type = 'scale'
-                    for rg in radiogroups:
-                        scale_radios = rg.find_elements(By.CSS_SELECTOR, 'div[role="radio"]')
-                        for sr in scale_radios:
-                            val = sr.get_attribute('data-value')
-                            if val:
-                                options_list.append(val)
-
-            # 7. Date picker
-            if not q_type:
-                date_inputs = qc.find_elements(By.CSS_SELECTOR, 'input[type="date"]')
-                if date_inputs:
-                    q_type = 'date'
-
-            # 8. Time picker
-            if not q_type:
-                time_inputs = qc.find_elements(By.CSS_SELECTOR, 'input[type="time"]')
-                if time_inputs:
-                    q_type = 'time'
-
-            if entry_id and q_type:
-                questions.append({
-                    'entry_id': entry_id,
-                    'type': q_type,
-                    'options': options_list,
-                })
-
-        driver.quit()
+        questions = scraped['questions']
+
         return {
             'action_url': action,
             'fbzx': fbzx,
@@ -171,41 +266,230 @@ def extract_form_structure(form_url):
         }
 
     except Exception as e:
-        driver.quit()
+        if shared:
+            _discard_driver()   # don't reuse a browser in an unknown state
         raise RuntimeError(f"Failed to parse form: {e}")
 
+# ---- Lightweight parser (requests + lxml, no browser) ----
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+_FB_DATA_RE = re.compile(r'FB_PUBLIC_LOAD_DATA_\s*=\s*(\[.*?\]);\s*</script>', re.S)
+
+# Question type codes used in FB_PUBLIC_LOAD_DATA_; others (grids, section
+# headers, images, page breaks) are skipped
+FB_TYPES = {
+    0: 'text',
+    1: 'paragraph',
+    2: 'radio',
+    3: 'dropdown',
+    4: 'checkbox',
+    5: 'scale',
+    9: 'date',
+    10: 'time',
+}
+
+def parse_form_html(html):
+    """Build the form structure from the viewform HTML, or None if it can't."""
+    match = _FB_DATA_RE.search(html)
+    if not match:
+        return None
+    tree = lxml.html.fromstring(html)
+    actions = tree.xpath('//form/@action')
+    fbzx = tree.xpath('//input[@name="fbzx"]/@value')
+    if not actions or not fbzx:
+        return None
+    page_history = tree.xpath('//input[@name="pageHistory"]/@value')
+
+    action = actions[0]
+    if not action.startswith('http'):
+        action = 'https://docs.google.com' + action
+
+    try:
+        items = json.loads(match.group(1))[1][1] or []
+    except (ValueError, IndexError, TypeError):
+        return None
+
+    # Each item is [id, title, description, type_code, [[entry_id, options, ...]], ...]
+    questions = []
+    for item in items:
+        if len(item) < 5 or not item[4]:
+            continue
+        q_type = FB_TYPES.get(item[3])
+        if q_type is None:
+            continue
+        entry_id, raw_opts = item[4][0][0], item[4][0][1]
+        questions.append({
+            'entry_id': f"entry.{entry_id}",
+            'type': q_type,
+            'options': [o[0] for o in raw_opts or [] if o and o[0]],
+        })
+
+    return {
+        'action_url': action,
+        'fbzx': fbzx[0],
+        'page_history': page_history[0] if page_history else None,
+        'questions': questions
+    }
+
+def extract_form_structure_lite(form_url):
+    """Fetch the form with a plain GET and parse it; None if it can't be parsed."""
+    print("📡 Parsing form structure over HTTP...")
+    resp = requests.get(form_url, headers={'User-Agent': USER_AGENT}, timeout=15)
+    resp.raise_for_status()
+    return parse_form_html(resp.text)
+
+@functools.lru_cache(maxsize=32)
+def parse_form(form_url):
+    """Return the form structure, falling back to Selenium when the lite parser fails.
+
+    Memoized per URL for the life of the process; callers must not mutate
+    the returned dict.
+    """
+    if lxml is not None:
+        try:
+            form_struct = extract_form_structure_lite(form_url)
+        except requests.RequestException as e:
+            print(f"⚠️ HTTP fetch failed ({e})")
+            form_struct = None
+        if form_struct is not None:
+            return form_struct
+        print("⚠️ Could not parse the form HTML, falling back to Selenium")
+    return extract_form_structure(form_url)
+
 # ------------------------------------------------------------
 # 2.  Random answer generators
 # ------------------------------------------------------------
+_WORDS = ('apple', 'banana', 'car', 'dog', 'energy', 'finance', 'goal', 'happy',
+          'investment', 'job', 'knowledge', 'life', 'money', 'nature', 'option',
+          'plan', 'quality', 'return', 'stock', 'time', 'value', 'work', 'xray',
+          'young', 'zebra')
+
+_tls = threading.local()
+
+def _rng():
+    """Per-thread Random, so pool workers don't share one generator."""
+    r = getattr(_tls, 'r', None)
+    if r is None:
+        r = _tls.r = random.Random(os.urandom(16))
+    return r
+
 def random_text():
-    words = ['apple', 'banana', 'car', 'dog', 'energy', 'finance', 'goal', 'happy',
-             'investment', 'job', 'knowledge', 'life', 'money', 'nature', 'option',
-             'plan', 'quality', 'return', 'stock', 'time', 'value', 'work', 'xray',
-             'young', 'zebra']
-    return ' '.join(random.sample(words, random.randint(2, 5)))
+    # Sampling with replacement is fine for junk answers and avoids sample()'s
+    # per-call bookkeeping
+    r = _rng()
+    return ' '.join(r.choices(_WORDS, k=r.randint(2, 5)))
 
 def random_paragraph():
     return random_text() + '. ' + random_text() + '.'
 
 def random_date():
-    return f"{random.randint(2000,2030)}-{random.randint(1,12):02d}-{random.randint(1,28):02d}"
+    r = _rng()
+    return f"{r.randint(2000,2030)}-{r.randint(1,12):02d}-{r.randint(1,28):02d}"
 
 def random_time():
-    return f"{random.randint(0,23):02d}:{random.randint(0,59):02d}"
+    r = _rng()
+    return f"{r.randint(0,23):02d}:{r.randint(0,59):02d}"
 
 def random_choice(options):
-    return random.choice(options) if options else ""
+    return _rng().choice(options) if options else ""
 
 def random_multiple(options):
     """Select a random subset of options (1 up to half of total)."""
     if not options:
         return []
-    k = random.randint(1, max(1, len(options)//2))
-    return random.sample(options, k)
+    r = _rng()
+    k = r.randint(1, max(1, len(options)//2))
+    return r.sample(options, k)
+
+def predraw_answers(varying, M, rng=None):
+    """Draw the answers for all M submissions up front with numpy.
+
+    Returns one list per question in varying; item i of that list holds the
+    values to send for submission i. Same distributions as the random_*
+    helpers above.
+    """
+    if M <= 0:
+        return [[] for _ in varying]
+    rng = rng or np.random.default_rng()
+    words = np.array(_WORDS, dtype=object)
+
+    def texts():
+        picks = words[rng.integers(0, len(_WORDS), size=(M, 5))].tolist()
+        lengths = rng.integers(2, 6, size=M).tolist()
+        return [' '.join(row[:k]) for row, k in zip(picks, lengths)]
+
+    draws = []
+    for q in varying:
+        qtype = q['type']
+        opts = np.array(q['options'], dtype=object)
+        n = len(opts)
+
+        if qtype in ('radio', 'dropdown', 'scale') and n:
+            draws.append([[v] for v in opts[rng.integers(0, n, size=M)].tolist()])
+
+        elif qtype == 'checkbox' and n:
+            ks = rng.integers(1, max(1, n//2) + 1, size=M).tolist()
+            rows = opts[rng.permuted(np.tile(np.arange(n), (M, 1)), axis=1)].tolist()
+            draws.append([row[:k] for row, k in zip(rows, ks)])
+
+        elif qtype == 'text':
+            draws.append([[t] for t in texts()])
+
+        elif qtype == 'paragraph':
+            draws.append([[f"{a}. {b}."] for a, b in zip(texts(), texts())])
+
+        elif qtype == 'date':
+            ys = rng.integers(2000, 2031, size=M).tolist()
+            ms = rng.integers(1, 13, size=M).tolist()
+            ds = rng.integers(1, 29, size=M).tolist()
+            draws.append([[f"{y}-{m:02d}-{d:02d}"] for y, m, d in zip(ys, ms, ds)])
+
+        elif qtype == 'time':
+            hs = rng.integers(0, 24, size=M).tolist()
+            ms = rng.integers(0, 60, size=M).tolist()
+            draws.append([[f"{h:02d}:{m:02d}"] for h, m in zip(hs, ms)])
+
+        else:
+            draws.append([[]] * M)      # nothing to answer
+    return draws
 
 # ------------------------------------------------------------
 # 3.  Build POST data for one submission
 # ------------------------------------------------------------
+CHOICE_TYPES = ('radio', 'dropdown', 'checkbox', 'scale')
+
+def answer_question(q, data):
+    """Append random (entry, value) pairs answering question q to data."""
+    entry = q['entry_id']
+    qtype = q['type']
+    opts = q['options']
+
+    if qtype in ('radio', 'dropdown'):
+        if opts:
+            data.append((entry, random_choice(opts)))
+        # else skip – no options available
+
+    elif qtype == 'checkbox':
+        selected = random_multiple(opts)
+        for val in selected:
+            data.append((entry, val))
+
+    elif qtype == 'text':
+        data.append((entry, random_text()))
+
+    elif qtype == 'paragraph':
+        data.append((entry, random_paragraph()))
+
+    elif qtype == 'date':
+        data.append((entry, random_date()))
+
+    elif qtype == 'time':
+        data.append((entry, random_time()))
+
+    elif qtype == 'scale':
+        if opts:
+            data.append((entry, random_choice(opts)))
+
 def build_post_data(form_struct):
     """Return a list of (key, value) tuples suitable for requests.post(data=...)."""
     data = []
@@ -216,104 +500,359 @@ def build_post_data(form_struct):
 
     # Answer each question
     for q in form_struct['questions']:
-        entry = q['entry_id']
-        qtype = q['type']
-        opts = q['options']
-
-        if qtype in ('radio', 'dropdown'):
-            if opts:
-                data.append((entry, random_choice(opts)))
-            # else skip – no options available
-
-        elif qtype == 'checkbox':
-            selected = random_multiple(opts)
-            for val in selected:
-                data.append((entry, val))
+        answer_question(q, data)
 
-        elif qtype == 'text':
-            data.append((entry, random_text()))
-
-        elif qtype == 'paragraph':
-            data.append((entry, random_paragraph()))
-
-        elif qtype == 'date':
-            data.append((entry, random_date()))
+    return data
 
-        elif qtype == 'time':
-            data.append((entry, random_time()))
+def precompute_static_body(form_struct):
+    """Split the POST body into the part that never changes and the rest.
 
-        elif qtype == 'scale':
-            if opts:
-                data.append((entry, random_choice(opts)))
+    Returns (static_body, varying): static_body is the urlencoded fbzx,
+    pageHistory and every question whose answer is fixed (a choice with at
+    most one option); varying is the list of questions to randomise per POST.
+    """
+    static = [('fbzx', form_struct['fbzx'])]
+    if form_struct.get('page_history'):
+        static.append(('pageHistory', form_struct['page_history']))
 
-    return data
+    varying = []
+    for q in form_struct['questions']:
+        if q['type'] in CHOICE_TYPES and len(q['options']) <= 1:
+            answer_question(q, static)
+        else:
+            varying.append(q)
+    return urlencode(static).encode('ascii'), varying
+
+def encode_answers(data):
+    """urlencode (entry, value) pairs; entry IDs are URL-safe, so only values are quoted."""
+    return '&'.join([entry + '=' + quote_plus(val) for entry, val in data]).encode('ascii')
+
+def build_post_body(static_body, varying, draws=None, i=0):
+    """Return the urlencoded body for submission i as bytes.
+
+    With draws (from predraw_answers) the answers are looked up by index;
+    without, they are generated on the spot.
+    """
+    data = []
+    if draws is None:
+        for q in varying:
+            answer_question(q, data)
+    else:
+        for q, answers in zip(varying, draws):
+            entry = q['entry_id']
+            data.extend((entry, val) for val in answers[i])
+    if not data:
+        return static_body
+    return static_body + b'&' + encode_answers(data)
 
 # ------------------------------------------------------------
 # 4.  Main: cache management + bulk POST
 # ------------------------------------------------------------
+_FORM_ID_RE = re.compile(r'/d/e/([^/]+)')
+
 def get_cache_filename(form_url):
     """Create a unique, safe filename from the form URL."""
     # Extract form ID (long string after /d/e/)
-    match = re.search(r'/d/e/([^/]+)', form_url)
+    match = _FORM_ID_RE.search(form_url)
     if match:
         form_id = match.group(1)
     else:
         # fallback: hash the whole URL
-        form_id = hashlib.md5(form_url.encode()).hexdigest()[:10]
+        form_id = hashlib.blake2b(form_url.encode(), digest_size=5).hexdigest()
     return f"google_form_{form_id}.json"
 
-def main():
-    if len(sys.argv) != 3:
-        print("Usage: python google_form_bulk_submit.py <FORM_URL> <M>")
-        sys.exit(1)
+def load_cache(path):
+    """Read a cached form structure (compact JSON)."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-    form_url = sys.argv[1]
-    try:
-        M = int(sys.argv[2])
-    except ValueError:
-        print("M must be an integer.")
-        sys.exit(1)
+def save_cache(path, form_struct):
+    """Write a form structure as compact JSON; pretty-printing only costs bytes."""
+    if orjson is not None:
+        raw = orjson.dumps(form_struct)
+    else:
+        raw = json.dumps(form_struct, separators=(',', ':')).encode()
+    with open(path, 'wb') as f:
+        f.write(raw)
 
+def load_form_structure(form_url):
+    """Return the form structure from the disk cache, parsing (memoized) on a miss."""
     cache_file = get_cache_filename(form_url)
-
-    # ---- Load or extract form structure ----
     if os.path.exists(cache_file):
         print(f"📁 Loading cached form structure from {cache_file}")
-        with open(cache_file, 'r') as f:
-            form_struct = json.load(f)
-    else:
-        form_struct = extract_form_structure(form_url)
-        with open(cache_file, 'w') as f:
-            json.dump(form_struct, f, indent=2)
-        print(f"💾 Form structure cached to {cache_file}")
+        return load_cache(cache_file)
 
-    # ---- Bulk submissions ----
-    print(f"🚀 Submitting {M} responses...")
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    form_struct = parse_form(form_url)
+    save_cache(cache_file, form_struct)
+    print(f"💾 Form structure cached to {cache_file}")
+    return form_struct
+
+def build_headers(form_url):
+    """Browser‑like headers shared by every submission."""
+    return {
+        'User-Agent': USER_AGENT,
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
         'Content-Type': 'application/x-www-form-urlencoded',
         'Origin': 'https://docs.google.com',
         'Referer': form_url,
-    })
+    }
+
+PROGRESS_EVERY = 100    # without tqdm, print progress once per this many results
+
+class Tally:
+    """Counts submission outcomes and shows progress without a print per request."""
+
+    def __init__(self, M):
+        self.M = M
+        self.done = 0
+        self.statuses = Counter()
+        self.errors = Counter()
+        self.bar = tqdm(total=M, unit='resp') if tqdm is not None else None
+
+    def add(self, result):
+        """Record an HTTP status code or the exception a submission raised."""
+        if isinstance(result, Exception):
+            self.errors[f"{type(result).__name__}: {result}"] += 1
+        else:
+            self.statuses[result] += 1
+        self.done += 1
+        if self.bar is not None:
+            self.bar.update()
+        elif self.done % PROGRESS_EVERY == 0 or self.done == self.M:
+            print(f"⏳ {self.done}/{self.M} sent")
+
+    def close(self):
+        """Print non‑200 outcomes and return the number of HTTP 200s."""
+        if self.bar is not None:
+            self.bar.close()
+        for status, n in sorted(self.statuses.items()):
+            if status != 200:
+                print(f"⚠️ {n} returned {status}")
+        for err, n in self.errors.most_common():
+            print(f"❌ {n} error(s): {err}")
+        return self.statuses[200]
+
+DEFAULT_RPS = 10        # submissions per second unless --rps says otherwise
+
+class RateLimiter:
+    """Thread-safe limiter: at most `rps` request starts in any window.
+
+    Keeps the start times of the last few requests in a ring buffer; a new
+    request may start once the oldest one in the buffer is a full window old.
+    Also usable with `async with` when aiolimiter isn't installed.
+    """
+
+    def __init__(self, rps):
+        burst = max(1, int(rps))
+        self.window = burst / rps       # seconds per `burst` starts
+        self.starts = deque(maxlen=burst)
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Claim the next free start slot; return seconds to wait for it."""
+        with self.lock:
+            now = time.monotonic()
+            start = now
+            if len(self.starts) == self.starts.maxlen:
+                start = max(now, self.starts[0] + self.window)
+            self.starts.append(start)
+            return start - now
+
+    def acquire(self):
+        time.sleep(self.reserve())
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.reserve())
+
+    async def __aexit__(self, *exc):
+        return False
+
+# ---- Concurrent path (httpx over HTTP/2, else aiohttp) ----
+MAX_IN_FLIGHT = 50      # concurrent POSTs allowed at any moment
+MAX_CONNECTIONS = 100   # size of the aiohttp connection pool
+H2_CONNECTIONS = 8      # HTTP/2 multiplexes streams, so a few sockets suffice
+
+ASYNC_ERRORS = tuple(
+    [asyncio.TimeoutError]
+    + ([aiohttp.ClientError] if aiohttp is not None else [])
+    + ([httpx.HTTPError] if httpx is not None else [])
+)
+
+def open_async_session(headers):
+    """Return the async client to use as `async with`: httpx/HTTP2 if available."""
+    if httpx is not None:
+        return httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            follow_redirects=True,      # like aiohttp and requests
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=H2_CONNECTIONS),
+            timeout=httpx.Timeout(30.0, pool=None),     # queued streams wait, not fail
+        )
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    return aiohttp.ClientSession(headers=headers, connector=connector)
+
+def _is_httpx(session):
+    return httpx is not None and isinstance(session, httpx.AsyncClient)
+
+async def http_post(session, url, body):
+    """POST body and return the status code."""
+    if _is_httpx(session):
+        return (await session.post(url, content=body)).status_code
+    async with session.post(url, data=body) as r:
+        return r.status
+
+async def http_head(session, url):
+    if _is_httpx(session):
+        await session.head(url)
+        return
+    async with session.head(url, allow_redirects=True):
+        pass
+
+def make_async_limiter(rps):
+    """Return a limiter for `async with`, or None when rps is 0 (unlimited)."""
+    if not rps:
+        return None
+    if AsyncLimiter is not None:
+        # Capacity must hold at least one token, so fractional rates get a
+        # longer window instead (same shape as RateLimiter)
+        burst = max(1, int(rps))
+        return AsyncLimiter(burst, burst / rps)
+    return RateLimiter(rps)
+
+async def submit_one(session, url, data, sem, limiter=None):
+    """POST one response, holding a semaphore slot while in flight."""
+    async with sem:
+        if limiter is not None:
+            async with limiter:     # waits for a token, then releases nothing
+                pass
+        return await http_post(session, url, data)
+
+async def submit_all_async(session, form_struct, M, rps=0):
+    """Submit M responses concurrently over session; return the number of HTTP 200s."""
+    url = form_struct['action_url']
+    sem = asyncio.Semaphore(MAX_IN_FLIGHT)
+    limiter = make_async_limiter(rps)
+    tally = Tally(M)
+
+    async def tracked(body):
+        try:
+            tally.add(await submit_one(session, url, body, sem, limiter))
+        except Exception as e:
+            tally.add(e)
+
+    static_body, varying = precompute_static_body(form_struct)
+    draws = predraw_answers(varying, M) if np is not None else None
+    await asyncio.gather(*[tracked(build_post_body(static_body, varying, draws, i))
+                           for i in range(M)])
+    return tally.close()
 
-    success = 0
-    for i in range(M):
-        post_data = build_post_data(form_struct)
+def guess_action_url(form_url):
+    """Return the likely formResponse URL for a /viewform link."""
+    return re.sub(r'/viewform.*$', '/formResponse', form_url)
+
+async def warm_up(session, url):
+    """HEAD url so a TCP+TLS connection is already open for the first POST."""
+    try:
+        await http_head(session, url)
+    except ASYNC_ERRORS:
+        pass    # only an optimisation
+
+async def load_form_structure_async(session, form_url):
+    """Async counterpart of load_form_structure.
+
+    The shared (disk-cached, memoized) loader runs in a worker thread while a
+    HEAD to the POST endpoint opens a connection on session, so submissions
+    start on a warm socket.
+    """
+    loop = asyncio.get_running_loop()
+    form_struct, _ = await asyncio.gather(
+        loop.run_in_executor(None, load_form_structure, form_url),
+        warm_up(session, guess_action_url(form_url)),
+    )
+    return form_struct
+
+async def async_main(form_url, M, headers, rps=0):
+    """Load the form and submit M responses over one async session."""
+    async with open_async_session(headers) as session:
+        form_struct = await load_form_structure_async(session, form_url)
+        print(f"🚀 Submitting {M} responses...")
+        return await submit_all_async(session, form_struct, M, rps)
+
+# ---- Threaded fallback (requests) ----
+SYNC_WORKERS = 32       # threads with a POST in flight at any moment
+SYNC_POOL_SIZE = 64     # urllib3 connections kept alive to docs.google.com
+
+def submit_all_sync(form_struct, M, headers, rps=0):
+    """Submit M responses from a thread pool; return the number of HTTP 200s."""
+    session = requests.Session()
+    session.headers.update(headers)
+    session.headers['Connection'] = 'keep-alive'
+    # Single host, so one pool with enough sockets for every worker.
+    # Only failed connects are retried: the POST was never sent, so this can't
+    # record a duplicate response. Read errors and 5xx are counted as-is,
+    # matching the httpx/aiohttp paths, which don't retry at all.
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=SYNC_POOL_SIZE,
+        max_retries=Retry(connect=2, read=0, status=0, backoff_factor=0.1),
+    )
+    session.mount('https://', adapter)
+    url = form_struct['action_url']
+    static_body, varying = precompute_static_body(form_struct)
+    draws = predraw_answers(varying, M) if np is not None else None
+    limiter = RateLimiter(rps) if rps else None
+
+    def post_one(i):
+        # Errors are returned, not raised, so one failure doesn't abort ex.map
         try:
-            resp = session.post(form_struct['action_url'], data=post_data)
-            if resp.status_code == 200:
-                success += 1
-                print(f"✅ {i+1}/{M} submitted (HTTP 200)")
-            else:
-                print(f"⚠️ {i+1}/{M} returned {resp.status_code}")
+            if limiter is not None:
+                limiter.acquire()
+            body = build_post_body(static_body, varying, draws, i)
+            return session.post(url, data=body).status_code
         except Exception as e:
-            print(f"❌ {i+1}/{M} error: {e}")
+            return e
+
+    tally = Tally(M)
+    with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as ex:
+        for res in ex.map(post_one, range(M)):
+            tally.add(res)
+    return tally.close()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="One‑step Google Form bulk submitter.")
+    parser.add_argument('form_url', metavar='FORM_URL', help="the form's viewform URL")
+    parser.add_argument('M', type=int, help="number of responses to submit")
+    parser.add_argument('--rps', type=float, default=DEFAULT_RPS,
+                        help=f"max submissions per second, 0 for no limit (default {DEFAULT_RPS})")
+    args = parser.parse_args(argv)
+    if args.M < 0:
+        parser.error("M must be 0 or positive")
+    if not math.isfinite(args.rps) or args.rps < 0:
+        parser.error("--rps must be 0 or a positive finite number")
+    return args
 
-        # Be polite – random delay between 0.3 and 1.5 seconds
-        time.sleep(random.uniform(0.3, 1.5))
+def main():
+    args = parse_args()
+    form_url, M = args.form_url, args.M
+
+    # ---- Load form structure + bulk submissions ----
+    headers = build_headers(form_url)
+    if httpx is not None or aiohttp is not None:
+        # uvloop's libuv loop has less per-callback overhead (not on Windows).
+        # uvloop.run exists from 0.18; older versions install the policy.
+        run = asyncio.run
+        if uvloop is not None:
+            if hasattr(uvloop, 'run'):
+                run = uvloop.run
+            else:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        success = run(async_main(form_url, M, headers, args.rps))
+    else:
+        form_struct = load_form_structure(form_url)
+        print(f"🚀 Submitting {M} responses...")
+        success = submit_all_sync(form_struct, M, headers, args.rps)
 
     print(f"\n🎉 Done. {success}/{M} submissions successful.")
 